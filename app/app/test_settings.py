@@ -0,0 +1,52 @@
+import os
+
+from .settings import *  # noqa
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/3.2/topics/testing/overview/#password-hashing
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Database
+# https://docs.djangoproject.com/en/3.2/topics/testing/overview/#the-test-database
+
+# Tests run against Postgres whenever DB_HOST is set, as it is in
+# docker-compose and CI, so backend specific behaviour stays covered.
+# Local runs without a database server fall back to an in-memory SQLite
+# database, which is faster but does not exercise Postgres.
+
+if os.environ.get('DB_HOST'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'HOST': os.environ.get('DB_HOST'),
+            'NAME': os.environ.get('DB_NAME'),
+            'USER': os.environ.get('DB_USER'),
+            'PASSWORD': os.environ.get('DB_PASSWORD'),
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+
+# N+1 query detection
+# https://github.com/jmcarp/nplusone
+
+INSTALLED_APPS += [  # noqa: F405
+    'nplusone.ext.django',
+]
+
+MIDDLEWARE = [
+    'nplusone.ext.django.NPlusOneMiddleware',
+] + MIDDLEWARE  # noqa: F405
+
+NPLUSONE_RAISE = True
@@ -18,8 +18,7 @@ def create_user(**params):
 class PublicIngredientsApiTest(TestCase):
     """Test the publicly available ingredients api"""
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
     
     def test_login_required(self):
         """Test that login is required for retrieving ingredients"""
@@ -30,13 +29,17 @@ class PublicIngredientsApiTest(TestCase):
 class PrivateIngredientsApiTests(TestCase):
     """Test the authorized user ingredients API"""
 
-    def setUp(self):
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email = "test@gmail.com",
             password="testpass",
             name="Test Name"
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
     
     def test_retrieve_ingredients(self):
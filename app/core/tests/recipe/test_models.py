@@ -10,21 +10,25 @@ def sample_user(email="test@gmail.com",password="testpass"):
 class ModelTests(TestCase):
     """Test all models of recipe app"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = sample_user()
+
     def test_tag_str(self):
         """Test the tag string representation"""
-        tag = Tag.objects.create(user = sample_user(),name = 'Vegan')
+        tag = Tag.objects.create(user = self.user,name = 'Vegan')
         self.assertEqual(str(tag), tag.name)
     
     def test_ingredient_str(self):
         """Test the Ingredient string representation"""
-        ingredient = Ingredient.objects.create(user = sample_user(),name = 'Cucumber')
+        ingredient = Ingredient.objects.create(user = self.user,name = 'Cucumber')
         self.assertEqual(str(ingredient), ingredient.name)
     
 
     def test_recipe_str(self):
         """Test the Recipe string representation"""
         recipe = Recipe.objects.create(
-            user = sample_user(),
+            user = self.user,
             title = 'Steak and mashroo sauce',
             time_minutes = 5,
             price = 5.00
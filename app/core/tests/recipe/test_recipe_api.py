@@ -1,5 +1,6 @@
 import tempfile
 import os
+from functools import lru_cache
 from PIL import Image
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -14,10 +15,18 @@ from recipe.serializers import RecipeSerializer,RecipeDetailSerializer
 
 RECIPES_URL = reverse('recipe:recipe-list')
 
+USER_DEFAULTS = {
+    'email' : 'test@gmail.com',
+    'password' : 'testpass',
+    'name' : 'Test Name'
+}
+
+@lru_cache(maxsize=None)
 def detail_url(recipe_id):
     """Return recipe detail url """
     return reverse('recipe:recipe-detail',args=[recipe_id])
 
+@lru_cache(maxsize=None)
 def image_upload_url(recipe_id):
     """Return uploaded recipe image url """
     return reverse('recipe:recipe-upload-image',args=[recipe_id])
@@ -46,12 +55,32 @@ def sample_recipe(user,**params):
 
     return Recipe.objects.create(user=user,**defaults)
 
+def bulk_sample_recipes(user,n,tags=(),ingredients=()):
+    """Create n sample recipes and their tag and ingredient links in bulk"""
+    Recipe.objects.bulk_create([
+        Recipe(user=user,title=f'Sample Recipe {i}',time_minutes=10,price=5.00)
+        for i in range(n)
+    ])
+    recipe_ids = list(
+        Recipe.objects.filter(user=user).order_by('-id').values_list('id',flat = True)[:n]
+    )
+
+    Recipe.tags.through.objects.bulk_create([
+        Recipe.tags.through(recipe_id=recipe_id,tag_id=tag.id)
+        for recipe_id in recipe_ids for tag in tags
+    ])
+    Recipe.ingredients.through.objects.bulk_create([
+        Recipe.ingredients.through(recipe_id=recipe_id,ingredient_id=ingredient.id)
+        for recipe_id in recipe_ids for ingredient in ingredients
+    ])
+
+    return recipe_ids
+
 
 class PublicIngredientsApiTest(TestCase):
     """Test the publicly available recipe api"""
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
     
     def test_login_required(self):
         """Test that login is required for retrieving recipe"""
@@ -62,77 +91,48 @@ class PublicIngredientsApiTest(TestCase):
 class PrivateIngredientsApiTests(TestCase):
     """Test the authorized user recipe API"""
 
-    def setUp(self):
-        self.user = create_user(
-            email = "test@gmail.com",
-            password="testpass",
-            name="Test Name"
-        )
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.user)
-    
-    def test_retrieve_recipes(self):
-        """Test retrieving recipes"""
-        sample_recipe(user=self.user)
-        sample_recipe(user=self.user)
-
-        res = self.client.get(RECIPES_URL)
-
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes,many = True)
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
-    
-    def test_retrieve_user_ingredients_only(self):
-        """Test that recipes returned are for the authenticated user"""
-        user2 = create_user(
-            email = "other@gmail.com",
-            password="testpass",
-            name="Other Name"
-        )
+    client_class = APIClient
 
-        sample_recipe(user=user2)
-        sample_recipe(user=self.user)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(**USER_DEFAULTS)
 
-        res = self.client.get(RECIPES_URL)
-
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes,many = True)
-        
-        
-        self.assertEqual(res.status_code,status.HTTP_200_OK)
-        self.assertEqual(len(res.data),1)
-        self.assertEqual(res.data, serializer.data)
-    
-    def test_view_recipe_detail(self):
-        """test viewing a recipe detail"""
-        recipe = sample_recipe(user=self.user)
-        recipe.tags.add(sample_tag(user=self.user))
-        recipe.ingredients.add(sample_ingredient(user=self.user))
-
-        url = detail_url(recipe.id)
-
-        res = self.client.get(url)
-
-        serializer = RecipeDetailSerializer(recipe)
-        self.assertEqual(res.data, serializer.data)
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
     
+    def test_retrieve_recipes_query_count(self):
+        """Test retrieving recipes does not issue a query per recipe"""
+        tag = sample_tag(user=self.user)
+        ingredient = sample_ingredient(user=self.user)
+
+        for count in (1, 10):
+            Recipe.objects.all().delete()
+            bulk_sample_recipes(
+                user=self.user,
+                n=count,
+                tags=[tag],
+                ingredients=[ingredient]
+            )
+
+            with self.assertNumQueries(3):
+                res = self.client.get(RECIPES_URL)
+
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(res.data), count)
 
     def test_create_basic_recipe(self):
         """Test creating basic recipe"""
         payload = {
             'title' : 'Chocolate cheesecake',
             'time_minutes' : 30,
-            'price' : 5.00
+            'price' : '5.00'
         }
 
         res = self.client.post(RECIPES_URL,payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.get(id = res.data['id'])
         for key in payload.keys():
-            self.assertEqual(payload[key], getattr(recipe,key))
+            self.assertEqual(payload[key], res.data[key])
     
     def test_create_recipe_with_tags(self):
         """Test create a recipe with tags"""
@@ -149,11 +149,7 @@ class PrivateIngredientsApiTests(TestCase):
         res = self.client.post(RECIPES_URL,payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
-        recipe = Recipe.objects.get(id = res.data['id'])
-        tags = recipe.tags.all()
-        self.assertEqual(tags.count(), 2)
-        self.assertIn(tag1,tags)
-        self.assertIn(tag2,tags)
+        self.assertCountEqual(res.data['tags'], [tag1.id,tag2.id])
 
     
     def test_create_recipe_with_ingredients(self):
@@ -171,13 +167,41 @@ class PrivateIngredientsApiTests(TestCase):
         res = self.client.post(RECIPES_URL,payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
-        recipe = Recipe.objects.get(id = res.data['id'])
-        ingredients = recipe.ingredients.all()
-        self.assertEqual(ingredients.count(), 2)
-        self.assertIn(ingredient1,ingredients)
-        self.assertIn(ingredient2,ingredients)
+        self.assertCountEqual(res.data['ingredients'], [ingredient1.id,ingredient2.id])
     
 
+    def test_create_recipe_with_tags_query_count(self):
+        """Test creating a recipe does not issue a query per tag"""
+        for count in (2, 4):
+            tags = [sample_tag(user = self.user, name = f'Tag {i}') for i in range(count)]
+            payload = {
+                'title' : 'Chocolate cheesecake',
+                'tags'  : [tag.id for tag in tags],
+                'time_minutes' : 30,
+                'price' : 5.00
+            }
+
+            with self.assertNumQueries(7):
+                res = self.client.post(RECIPES_URL,payload)
+
+            self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+    def test_create_recipe_with_bool_tag_invalid(self):
+        """Test that a boolean tag id is rejected"""
+        sample_tag(user = self.user)
+        payload = {
+            'title' : 'Chocolate cheesecake',
+            'tags'  : [True],
+            'ingredients' : [],
+            'time_minutes' : 30,
+            'price' : 5.00
+        }
+
+        res = self.client.post(RECIPES_URL,payload,format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data['tags'][0].code, 'incorrect_type')
+
     def test_partial_update_recipe(self):
         """test updating a recipe with patch """
         recipe = sample_recipe(user = self.user)
@@ -220,15 +244,65 @@ class PrivateIngredientsApiTests(TestCase):
         self.assertEqual(len(tags), 0)
 
 
+class PrivateRecipeRetrieveApiTests(TestCase):
+    """Test retrieving recipes through the authorized user recipe API"""
+
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(**USER_DEFAULTS)
+        other_user = create_user(**{
+            **USER_DEFAULTS,
+            'email' : 'other@gmail.com',
+            'name' : 'Other Name'
+        })
+
+        cls.recipe = sample_recipe(user=cls.user)
+        cls.recipe.tags.add(sample_tag(user=cls.user))
+        cls.recipe.ingredients.add(sample_ingredient(user=cls.user))
+        sample_recipe(user=cls.user)
+        cls.other_recipe = sample_recipe(user=other_user)
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def test_retrieve_recipes(self):
+        """Test retrieving recipes"""
+        res = self.client.get(RECIPES_URL)
+
+        recipe_ids = Recipe.objects.filter(user=self.user).order_by('-id').values_list('id',flat = True)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([recipe['id'] for recipe in res.data], list(recipe_ids))
+
+    def test_retrieve_user_recipes_only(self):
+        """Test that recipes returned are for the authenticated user"""
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code,status.HTTP_200_OK)
+        self.assertEqual(len(res.data),2)
+        self.assertNotIn(self.other_recipe.id, [recipe['id'] for recipe in res.data])
+
+    def test_view_recipe_detail(self):
+        """test viewing a recipe detail"""
+        url = detail_url(self.recipe.id)
+
+        res = self.client.get(url)
+
+        serializer = RecipeDetailSerializer(self.recipe)
+        self.assertEqual(res.data, serializer.data)
+
+
 class RecipeImageUploadTests(TestCase):
 
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(**USER_DEFAULTS)
+
     def setUp(self):
-        self.user = create_user(
-            email = "test@gmail.com",
-            password="testpass",
-            name="Test Name"
-        )
-        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
         self.recipe = sample_recipe(user = self.user)
         
@@ -18,8 +18,7 @@ def create_user(**params):
 class PublicTagsApiTest(TestCase):
     """Test the publicly available tags api"""
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
     
     def test_login_required(self):
         """Test that login is required for retrieving tags"""
@@ -30,13 +29,17 @@ class PublicTagsApiTest(TestCase):
 class PrivateTagsApiTests(TestCase):
     """Test the authorized user tags API"""
 
-    def setUp(self):
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email = "test@gmail.com",
             password="testpass",
             name="Test Name"
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
     
     def test_retrieve_tags(self):
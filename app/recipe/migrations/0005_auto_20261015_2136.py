@@ -0,0 +1,21 @@
+# Generated by Django 3.2.2 on 2026-10-15 21:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipe', '0004_recipe_image'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ingredient',
+            index=models.Index(fields=['user', '-name'], name='recipe_ingr_user_id_d10915_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['user', '-name'], name='recipe_tag_user_id_17aeb4_idx'),
+        ),
+    ]
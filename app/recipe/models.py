@@ -1,21 +1,24 @@
 from django.db import models
 from django.conf import settings
 import uuid
-import os
 
 
 def recipe_image_file_path(instance,filename):
     """Generate file path for new recipe image"""
-    ext = filename.split('.')[-1]
-    filename = f'{uuid.uuid4()}.{ext}'
+    ext = filename.rpartition('.')[2]
 
-    return os.path.join('uploads/recipe/',filename)
+    return f'uploads/recipe/{uuid.uuid4()}.{ext}'
 
 class Tag(models.Model):
     """Tag to be used for a recipe"""
     name = models.CharField(max_length=255)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete = models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields = ['user','-name'])
+        ]
+
     def __str__(self):
         return self.name
 
@@ -25,6 +28,11 @@ class Ingredient(models.Model):
     name = models.CharField(max_length=255)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete = models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields = ['user','-name'])
+        ]
+
     def __str__(self):
         return self.name
 
@@ -1,6 +1,49 @@
+from django.core.exceptions import ValidationError
 from rest_framework import serializers
 from recipe.models import Tag,Ingredient,Recipe
 
+
+class ManyPrimaryKeyRelatedField(serializers.ManyRelatedField):
+    """Primary key list field that looks up all objects in one query"""
+    def __init__(self,queryset,pk_field = None,**kwargs):
+        super().__init__(
+            child_relation = serializers.PrimaryKeyRelatedField(
+                queryset = queryset,
+                pk_field = pk_field
+            ),
+            **kwargs
+        )
+
+    def to_internal_value(self,data):
+        """Validate the primary keys and return the matching objects"""
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        queryset = self.child_relation.get_queryset()
+        pk_field = queryset.model._meta.pk
+        values = []
+        pks = []
+        for item in data:
+            if self.child_relation.pk_field is not None:
+                item = self.child_relation.pk_field.to_internal_value(item)
+            try:
+                if isinstance(item, bool):
+                    raise TypeError
+                pks.append(pk_field.to_python(item))
+            except (TypeError, ValidationError):
+                self.child_relation.fail('incorrect_type', data_type=type(item).__name__)
+            values.append(item)
+
+        objects = queryset.in_bulk(pks)
+        for pk, item in zip(pks, values):
+            if pk not in objects:
+                self.child_relation.fail('does_not_exist', pk_value=item)
+
+        return [objects[pk] for pk in pks]
+
+
 class TagSerializer(serializers.ModelSerializer):
     """Serializer for tag object"""
     class Meta:
@@ -19,13 +62,11 @@ class IngredientSerializer(serializers.ModelSerializer):
 
 class RecipeSerializer(serializers.ModelSerializer):
     """Serializer for Recipe object"""
-    ingredients = serializers.PrimaryKeyRelatedField(
-        many = True,
+    ingredients = ManyPrimaryKeyRelatedField(
         queryset = Ingredient.objects.all()
     )
 
-    tags = serializers.PrimaryKeyRelatedField(
-        many = True,
+    tags = ManyPrimaryKeyRelatedField(
         queryset = Tag.objects.all()
     )
 
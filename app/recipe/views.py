@@ -21,7 +21,7 @@ class BaseRecipeAttrViewSet(viewsets.GenericViewSet,mixins.ListModelMixin,mixins
         if assigned_only:
             queryset = queryset.filter(recipe__isnull=False)
 
-        return queryset.filter(user=self.request.user).order_by('-name')
+        return queryset.only('id','name').filter(user=self.request.user).order_by('-name')
     
     def perform_create(self, serializer):
         """Create a new object"""
@@ -56,6 +56,9 @@ class RecipeViewSet(viewsets.ModelViewSet):
         ingredients = self.request.query_params.get('ingredients')
         queryset = self.queryset
 
+        if self.action == 'list':
+            queryset = queryset.prefetch_related('tags','ingredients')
+
         if tags:
             tag_ids = self._params_to_int(tags)
             queryset = queryset.filter(tags__id__in = tag_ids)